@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Hunting agent on a synthetic directory tree.
+
+    python benchmarks/bench_hunt.py [DIRS] [FILES_PER_DIR]   # default 20,000 x 20
+
+Builds a tree with a few SUID/SGID files and a fake "tmp" subtree holding
+fresh executables, then times docs/scripts/hunt_agent.py at several
+thread counts against the separate find(1) sweeps it replaces.
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "docs" / "scripts"))
+from hunt_agent import hunt
+
+
+def build_tree(root, n_dirs, files_per_dir):
+    dirs = [root]
+    for i in range(1, n_dirs):
+        # ~10-way fan-out so the tree is both wide and deep
+        parent = dirs[(i - 1) // 10]
+        d = os.path.join(parent, f"d{i}")
+        os.mkdir(d)
+        dirs.append(d)
+    for i, d in enumerate(dirs):
+        for j in range(files_per_dir):
+            with open(os.path.join(d, f"f{j}"), "wb") as f:
+                f.write(b"x")
+        if i % 1000 == 0:
+            os.chmod(os.path.join(d, "f0"), 0o4755)
+            os.chmod(os.path.join(d, "f1"), 0o2755)
+
+    tmp = os.path.join(root, "tmp")
+    os.mkdir(tmp)
+    for j in range(50):
+        path = os.path.join(tmp, f"payload{j}")
+        with open(path, "wb") as f:
+            f.write(b"\x7fELF" + b"\0" * 60)
+        os.chmod(path, 0o755 if j % 2 else 0o644)
+    return tmp
+
+
+def timed(label, fn):
+    start = time.perf_counter()
+    result = fn()
+    print(f"{label:<36} {time.perf_counter() - start:8.2f} s")
+    return result
+
+
+def main():
+    n_dirs = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    files_per_dir = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    base = tempfile.mkdtemp(prefix="hunt-bench-")
+    try:
+        root = os.path.join(base, "root")
+        os.mkdir(root)
+        tmp = timed(f"build {n_dirs:,} dirs x {files_per_dir} files", lambda: build_tree(root, n_dirs, files_per_dir))
+
+        for workers in (1, 4, 16):
+            report = timed(
+                f"hunt_agent, {workers} worker(s)",
+                lambda: hunt([root], temp_dirs=[tmp], workers=workers, procs=False),
+            )
+        counts = {k: len(v) for k, v in report["findings"].items()}
+        print(f"  scanned {report['scanned']}, findings {counts}")
+
+        if shutil.which("find"):
+            def find_sweeps():
+                subprocess.run(["find", root, "-xdev", "-type", "f", "-perm", "-4000"], capture_output=True)
+                subprocess.run(["find", root, "-xdev", "-type", "f", "-perm", "-2000"], capture_output=True)
+                subprocess.run(["find", tmp, "-type", "f", "-mtime", "-7", "-perm", "/111"], capture_output=True)
+
+            timed("find: SUID + SGID + temp sweeps", find_sweeps)
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Memory footprint of N articles as plain dicts vs bot/models.Article.
+
+    python benchmarks/bench_models.py [N]    # default N = 1,000,000
+
+Every item is decoded from its own JSON string, as the pipeline does, so
+the dict side pays for per-item tag lists and key references exactly like
+``json.loads`` output does.
+"""
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "bot"))
+from models import TAGS, Article
+
+SOURCES = ["The Hacker News", "BleepingComputer", "Dark Reading"]
+
+
+def sample_json(n):
+    rnd = random.Random(0)
+    for i in range(n):
+        yield json.dumps({
+            "id": f"{i:012x}",
+            "date": f"2026-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d}",
+            "title": f"Sample security story number {i}",
+            "summary": f"Summary text for story {i}.",
+            "url": f"https://example.com/news/{i}",
+            "source": rnd.choice(SOURCES),
+            "tags": rnd.sample(TAGS, rnd.randint(1, 3)),
+        })
+
+
+def measure(label, n, decode):
+    gc.collect()
+    tracemalloc.start()
+    items = [decode(raw) for raw in sample_json(n)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<10} {size / 2**20:9.1f} MiB  {size / n:7.1f} B/item")
+    del items
+    return size
+
+
+def time_codec(n):
+    dicts = [json.loads(raw) for raw in sample_json(n)]
+    start = time.perf_counter()
+    models = [Article.from_dict(d) for d in dicts]
+    decode = time.perf_counter() - start
+    start = time.perf_counter()
+    for m in models:
+        m.to_dict()
+    encode = time.perf_counter() - start
+    print(f"codec      from_dict {decode / n * 1e6:.2f} us/item, to_dict {encode / n * 1e6:.2f} us/item")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"{n:,} articles")
+    as_dict = measure("dict", n, json.loads)
+    as_model = measure("Article", n, lambda raw: Article.from_dict(json.loads(raw)))
+    print(f"Article uses {as_model / as_dict:.0%} of the dict footprint")
+    time_codec(min(n, 100_000))
+
+
+if __name__ == "__main__":
+    main()
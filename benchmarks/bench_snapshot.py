@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Cold-load time of the JSON archive vs the columnar snapshot.
+
+    python benchmarks/bench_snapshot.py [N]    # default N = 200,000
+
+Writes N synthetic recommendations both as pretty-printed JSON (the
+current archive format) and as a bot/snapshot.py file into a temp dir,
+then times reading the date + severity columns and the titles from each.
+"""
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "bot"))
+from models import SEVERITIES, TAGS, TECH, Recommendation, intern_tags
+from snapshot import Snapshot, write_snapshot
+
+
+def sample_items(n):
+    rnd = random.Random(0)
+    return [
+        Recommendation(
+            id=f"{i:012x}",
+            date=f"2026-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d}",
+            title=f"Sample security story number {i}",
+            url=f"https://example.com/news/{i}",
+            source=rnd.choice(["The Hacker News", "BleepingComputer", "Dark Reading"]),
+            summary=f"Summary text for story {i}. " * 4,
+            tags=intern_tags(rnd.sample(TAGS, rnd.randint(1, 3))),
+            tech=intern_tags(rnd.sample(TECH, rnd.randint(1, 2))),
+            severity=rnd.choice(SEVERITIES),
+            recommendations=["Validate backups.", "Review exposed RDP/VPN entry points."],
+        )
+        for i in range(n)
+    ]
+
+
+def timed(label, fn):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed * 1000:9.1f} ms")
+    return elapsed
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    items = sample_items(n)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = Path(tmp) / "security_recommendations.json"
+        snap_path = Path(tmp) / "archive.snap"
+        json_path.write_text(
+            json.dumps({"items": [i.to_dict() for i in items]}, ensure_ascii=False, indent=2),
+            encoding="utf-8",
+        )
+        write_snapshot(items, snap_path)
+        del items
+        print(f"{n:,} items: JSON {json_path.stat().st_size / 2**20:.1f} MiB, "
+              f"snapshot {snap_path.stat().st_size / 2**20:.1f} MiB")
+
+        def json_columns():
+            data = json.loads(json_path.read_text(encoding="utf-8"))
+            return [(i["date"], i["severity"]) for i in data["items"]]
+
+        def snap_columns():
+            snap = Snapshot(snap_path)
+            return snap.raw("date"), snap.raw("severity")
+
+        def json_titles():
+            data = json.loads(json_path.read_text(encoding="utf-8"))
+            return [i["title"] for i in data["items"]]
+
+        def snap_titles():
+            with Snapshot(snap_path) as snap:
+                return snap.text("title")
+
+        a = timed("JSON: date + severity", json_columns)
+        b = timed("snapshot: date + severity (zero-copy)", snap_columns)
+        c = timed("JSON: titles", json_titles)
+        d = timed("snapshot: titles", snap_titles)
+        print(f"speed-up: columns {a / b:.0f}x, titles {c / d:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
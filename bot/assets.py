@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""Match articles against the local asset inventory.
+
+The inventory is a CSV or JSON list of rows with ``vendor``, ``product``,
+``version`` and an optional ``asset`` (hostname / owner / CMDB id). It is
+loaded once into hash maps keyed by the first token of every product and
+vendor name, so matching an article is a single pass over its tokens.
+Deployed versions of each product are kept sorted, so a version range from
+the article resolves to a slice with two bisections instead of a scan.
+
+A version range only counts for a product when it is tied to that
+product's mention: written right after its name ("Chrome 120", "HTTP
+Server 2.4.50 to 2.4.57") or, for "fixed in" style phrases, in the same
+clause. Versions after another name ("OpenSSL 3.0.7") and IPv4 addresses
+are ignored, so a product with no tied range scores as unknown rather
+than as not affected.
+
+Results only go to the private AFFECTED_FILE, never to the published
+docs/. The scheduled workflow has no inventory on purpose; run
+``ASSET_INVENTORY=path/to/assets.csv python bot/main.py`` in a private
+checkout or on a self-hosted runner to get the per-advisory report.
+"""
+import csv
+import json
+import os
+import re
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+
+INVENTORY_FILES = [Path("data/assets.json"), Path("data/assets.csv")]
+# Per-article relevance, counts, advice and matched assets. Never publish
+# this: it shows which advisories hit internal hosts, so it lives in
+# git-ignored data/ only and nothing inventory-derived is written to docs/
+AFFECTED_FILE = Path("data/affected_assets.json")
+MAX_AFFECTED = 25
+PREFIX_MAX = 1 << 62
+
+# Relevance contributed by the strongest match level for a product
+SCORE_VENDOR = 20
+SCORE_PRODUCT = 60
+SCORE_VERSION = 100
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+# Dotted versions only, so counts like "600 firewalls" are never versions.
+# A trailing dot (end of sentence) is not part of the version.
+VERSION = r"v?(\d+(?:\.\d+)+)(?!\w|\.\d)"
+# Single-component versions ("Chrome 120") only where context says version
+ANY_VERSION = r"v?(\d+(?:\.\d+)*)(?!\w|\.\d)"
+FIX_WORDS = (
+    r"(?:fixed|patched|resolved|addressed|remediated)\s+in|"
+    r"(?:upgrade|update|upgrading|updating)\s+to"
+)
+RANGE_RES = [
+    # (regex, kind, keyword-led); keyword-led phrases may sit anywhere in
+    # the product's clause, bare versions must follow the product name
+    # "fixed in 2.4.58", "upgrade to version 120": the fix is not affected
+    (re.compile(r"(?:" + FIX_WORDS + r")\s+(?:version\s+|release\s+)?" + VERSION), "lt", True),
+    (re.compile(r"(?:" + FIX_WORDS + r")\s+(?:version|release)\s+" + ANY_VERSION), "lt", True),
+    # "2.4.50 to 2.4.58", "2.4.50 - 2.4.58", "2.4.50 through 2.4.58"
+    (re.compile(VERSION + r"\s*(?:to|through|-|–)\s*" + VERSION), "between", False),
+    # "before 2.4.58", "prior to 2.4.58", "< 2.4.58"
+    (re.compile(r"(?:before|prior to|earlier than|older than|below|<)\s*" + VERSION), "lt", True),
+    # "up to 2.4.58", "<= 2.4.58"
+    (re.compile(r"(?:up to|through|<=)\s*" + VERSION), "le", True),
+    # "2.4.58 and earlier", "2.4.58 or older"
+    (re.compile(VERSION + r"\s*(?:and|or)\s*(?:earlier|older|below|prior)"), "le", False),
+    # "version 120", "versions 2.4.58"
+    (re.compile(r"versions?\s+" + ANY_VERSION), "point", True),
+]
+POINT_RE = re.compile(r"(?<![\w.])" + VERSION)
+IPV4_RE = re.compile(r"\d{1,3}(?:\.\d{1,3}){3}")
+# Clause breaks; a dot only counts when followed by whitespace ("2.4" is not one)
+CLAUSE_RE = re.compile(r"[;!?\n]|\.\s")
+# Words that may sit between a product name and its version
+FILLER_WORDS = frozenset(("v", "version", "versions", "release", "releases", "build", "and", "or"))
+
+
+def tokenize(text):
+    return tuple(TOKEN_RE.findall(text.lower()))
+
+
+def parse_version(raw):
+    parts = re.findall(r"\d+", str(raw or ""))
+    return tuple(int(p) for p in parts) if parts else None
+
+
+def _product_regex(product):
+    """"[fixed in] <product> [version] N" for a product named in the text."""
+    name = r"\s+".join(re.escape(t) for t in product.lower().split())
+    return re.compile(
+        r"(?:(" + FIX_WORDS + r")\s+)?(?<![\w.])" + name + r"\s+(?:version\s+)?" + ANY_VERSION
+    )
+
+
+def _scan_ranges(text_l, products=()):
+    """Yield (start, keyword_led, product, (low, high, high_inclusive)).
+
+    ``product`` is the name from ``products`` a range was anchored to by
+    _product_regex, else None. Spans holding an IPv4 address are skipped.
+    """
+    consumed = []
+
+    def taken(span):
+        return any(s <= span[0] < e or span[0] <= s < span[1] for s, e in consumed)
+
+    matches = [(regex, kind, led, None) for regex, kind, led in RANGE_RES]
+    matches += [(_product_regex(p), "product", False, p) for p in products]
+    for regex, kind, led, product in matches:
+        for m in regex.finditer(text_l):
+            # Only the version part is claimed, so a product-anchored match
+            # does not shadow a keyword match earlier in the same sentence
+            span = m.span() if kind != "product" else m.span(2)
+            if taken(span):
+                continue
+            consumed.append(span)
+            if any(IPV4_RE.fullmatch(v) for v in m.groups() if v and v[0].isdigit()):
+                continue
+            if kind == "between":
+                rng = (parse_version(m.group(1)), parse_version(m.group(2)), True)
+            elif kind == "product":
+                v = parse_version(m.group(2))
+                rng = (None, v, False) if m.group(1) else (v, v, True)
+            elif kind == "point":
+                v = parse_version(m.group(1))
+                rng = (v, v, True)
+            else:
+                rng = (None, parse_version(m.group(1)), kind == "le")
+            yield m.start(), led, product, rng
+
+    for m in POINT_RE.finditer(text_l):
+        if taken(m.span(1)) or IPV4_RE.fullmatch(m.group(1)):
+            continue
+        v = parse_version(m.group(1))
+        yield m.start(), False, None, (v, v, True)
+
+
+def extract_version_ranges(text, products=()):
+    """Return (low, high, high_inclusive) intervals mentioned in text.
+
+    ``products`` are product names matched in the text; a number right
+    after one of them ("Chrome 120") counts as a version of it.
+    """
+    return [rng for _, _, _, rng in _scan_ranges(text.lower(), products)]
+
+
+def _range_owners(text, text_l, words, breaks, start, keyword_led, mentions):
+    """Return the product keys a range starting at ``start`` belongs to.
+
+    ``words`` are the token matches of ``text_l``, ``breaks`` the sorted
+    ends of its clause breaks and ``mentions`` (start, end, key) spans of
+    matched product / vendor names. Walking back over filler words and version numbers, a range
+    right after a mention is that product's; one after any other name
+    belongs to something else. Keyword-led phrases after an ordinary word
+    ("flaw fixed in 2.4.58") go to the nearest mention in the clause.
+    """
+    j = bisect_right(words, start, key=lambda w: w.end()) - 1
+    pos = start
+    while j >= 0:
+        w = words[j]
+        if CLAUSE_RE.search(text_l, w.end(), pos):
+            break
+        keys = {key for s, e, key in mentions if e == w.end()}
+        if keys:
+            return keys
+        if not (w.group().isdigit() or w.group() in FILLER_WORDS):
+            # A capitalized word is another product's name ("OpenSSL 3.0.7")
+            if not keyword_led or text[w.start()].isupper():
+                return set()
+            break
+        pos = w.start()
+        j -= 1
+
+    # Nearest mention in the same clause, preceding ones first
+    clause = bisect_right(breaks, start)
+    same = [(s, e, key) for s, e, key in mentions if bisect_right(breaks, s) == clause]
+    before = [m for m in same if m[1] <= start]
+    if before:
+        end = max(e for _, e, _ in before)
+        return {key for _, e, key in before if e == end}
+    if same:
+        first = min(s for s, _, _ in same)
+        return {key for s, _, key in same if s == first}
+    return set()
+
+
+def range_slices(versions, ranges):
+    """Merge (start, stop) index slices of sorted versions covered by ranges."""
+    slices = []
+    for low, high, inclusive in ranges:
+        start = 0 if low is None else bisect_left(versions, low)
+        if high is None:
+            stop = len(versions)
+        elif inclusive:
+            # "2.4" and "up to 120" also cover 2.4.x and 120.0.6099.x
+            stop = bisect_right(versions, high + (PREFIX_MAX,))
+        else:
+            stop = bisect_left(versions, high)
+        if start < stop:
+            slices.append((start, stop))
+
+    slices.sort()
+    merged = []
+    for start, stop in slices:
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], stop))
+        else:
+            merged.append((start, stop))
+    return merged
+
+
+def _read_rows(path):
+    if path.suffix.lower() == ".json":
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return data.get("items", []) if isinstance(data, dict) else data
+    # utf-8-sig: spreadsheet exports often start with a BOM
+    with path.open(newline="", encoding="utf-8-sig") as f:
+        return list(csv.DictReader(f))
+
+
+def build_index(rows):
+    """Build product/vendor phrase maps from inventory rows."""
+    products = {}  # product key -> {"name", "versions", "assets", "unversioned"}
+    phrases = {}  # first token -> list of (phrase tokens, kind, key)
+
+    for row in rows:
+        product = (row.get("product") or "").strip()
+        if not product:
+            continue
+        vendor = (row.get("vendor") or "").strip()
+        key = (vendor.lower(), product.lower())
+        asset = {
+            "asset": row.get("asset") or row.get("host") or "",
+            "vendor": vendor,
+            "product": product,
+            "version": str(row.get("version") or ""),
+        }
+        if key not in products:
+            products[key] = {"name": product, "versioned": [], "unversioned": []}
+            for phrase, kind in ((tokenize(product), "product"), (tokenize(vendor), "vendor")):
+                if phrase:
+                    phrases.setdefault(phrase[0], []).append((phrase, kind, key))
+        version = parse_version(asset["version"])
+        if version is None:
+            products[key]["unversioned"].append(asset)
+        else:
+            products[key]["versioned"].append((version, asset))
+
+    for entry in products.values():
+        versioned = sorted(entry.pop("versioned"), key=lambda va: va[0])
+        entry["versions"] = [v for v, _ in versioned]
+        entry["assets"] = [a for _, a in versioned]
+
+    # Longest phrases first so "exchange server" wins over "exchange"
+    for entries in phrases.values():
+        entries.sort(key=lambda e: -len(e[0]))
+
+    return {"products": products, "phrases": phrases}
+
+
+def load_inventory(paths=None):
+    """Load the first inventory file that exists, or None if there is none."""
+    env_path = os.environ.get("ASSET_INVENTORY")
+    candidates = [Path(env_path)] if env_path else (paths or INVENTORY_FILES)
+    for path in candidates:
+        if path.exists():
+            return build_index(_read_rows(path))
+    return None
+
+
+def save_affected_assets(new, keep_ids, path=AFFECTED_FILE):
+    """Merge {article id: report entry} into path, dropping ids no longer kept."""
+    data = {}
+    if path.exists():
+        data = json.loads(path.read_text(encoding="utf-8"))
+    data.update(new)
+    data = {k: v for k, v in data.items() if k in keep_ids}
+    if not data and not path.exists():
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def match_article(index, text):
+    """Return relevance (0-100), matched asset count and the first matched assets."""
+    text_l = text.lower()
+    # str.lower() can change the length of some non-ASCII text; offsets
+    # into the original are only used for capitalization, so fall back
+    text = text if len(text) == len(text_l) else text_l
+    words = list(TOKEN_RE.finditer(text_l))
+    tokens = tuple(w.group() for w in words)
+    phrases = index["phrases"]
+    levels = {}  # product key -> "vendor" | "product"
+    mentions = []  # (start, end, product key) of every matched name
+
+    for i, tok in enumerate(tokens):
+        for phrase, kind, key in phrases.get(tok, ()):
+            if tokens[i:i + len(phrase)] != phrase:
+                continue
+            mentions.append((words[i].start(), words[i + len(phrase) - 1].end(), key))
+            if kind == "product" or key not in levels:
+                levels[key] = kind
+
+    if not levels:
+        return {"relevance": 0, "affectedCount": 0, "affectedAssets": []}
+
+    by_name = {}
+    for key, kind in levels.items():
+        if kind == "product":
+            by_name.setdefault(index["products"][key]["name"], []).append(key)
+    breaks = [m.end() for m in CLAUSE_RE.finditer(text_l)]
+    ranges = {}  # product key -> ranges tied to its mention
+    for start, keyword_led, product, rng in _scan_ranges(text_l, by_name):
+        if product is not None:
+            owners = by_name[product]
+        else:
+            owners = _range_owners(text, text_l, words, breaks, start, keyword_led, mentions)
+        for key in owners:
+            ranges.setdefault(key, []).append(rng)
+
+    relevance = 0
+    count = 0
+    affected = []
+
+    for key, kind in levels.items():
+        if kind == "vendor":
+            relevance = max(relevance, SCORE_VENDOR)
+            continue
+
+        entry = index["products"][key]
+        unversioned = entry["unversioned"]
+        if key in ranges:
+            hits = range_slices(entry["versions"], ranges[key])
+            confirmed = sum(stop - start for start, stop in hits)
+            unknown = len(unversioned)
+        else:
+            # No version tied to this product: every deployed copy is a candidate
+            hits = [(0, len(entry["assets"]))]
+            confirmed = 0
+            unknown = len(entry["assets"]) + len(unversioned)
+
+        if confirmed:
+            relevance = max(relevance, SCORE_VERSION)
+        elif unknown:
+            relevance = max(relevance, SCORE_PRODUCT)
+        else:
+            # Product named, but every deployed version is outside the ranges
+            relevance = max(relevance, SCORE_VENDOR)
+
+        count += confirmed + unknown
+        for start, stop in hits:
+            room = MAX_AFFECTED - len(affected)
+            affected.extend(entry["assets"][start:min(stop, start + room)])
+        affected.extend(unversioned[:MAX_AFFECTED - len(affected)])
+
+    return {
+        "relevance": relevance,
+        "affectedCount": count,
+        "affectedAssets": affected,
+    }
@@ -2,6 +2,8 @@
 import json
 from pathlib import Path
 
+from models import Article, Recommendation, load_items
+
 NEWS_FILE = Path("docs/news.json")
 RECO_FILE = Path("docs/security_recommendations.json")
 FEED_FILE = Path("docs/data/feed.json")
@@ -12,30 +14,27 @@ def main():
         print("Missing news or recommendations file, exiting.")
         return
 
-    news_data = json.loads(NEWS_FILE.read_text(encoding="utf-8"))
-    reco_data = json.loads(RECO_FILE.read_text(encoding="utf-8"))
-
-    news_items = news_data.get("items", [])
-    reco_items = reco_data.get("items", [])
+    _, news_items = load_items(NEWS_FILE, Article)
+    _, reco_items = load_items(RECO_FILE, Recommendation)
 
     # Build map of recommendations by article id
-    reco_map = {item["id"]: item for item in reco_items}
+    reco_map = {item.id: item for item in reco_items}
 
     feed = []
     for news in news_items:
-        news_id = news.get("id")
+        news_id = news.id
         if not news_id or news_id not in reco_map:
             continue
 
         reco = reco_map[news_id]
 
         # Expand recommendations into structured fields
-        recos = reco.get("recommendations", [])
+        recos = reco.recommendations
         
         # Basic heuristic: split into who/risk/actions
         rec_who = ["Organizations using affected products or services."]
         rec_risk = [
-            f"Impact: {reco.get('severity', 'Medium')} severity incident.",
+            f"Impact: {reco.severity} severity incident.",
             "Review article for specific attack surface and exploitation details."
         ]
         rec_actions_0_24 = recos[:2] if len(recos) >= 2 else recos
@@ -44,12 +43,12 @@ def main():
 
         feed_item = {
             "id": news_id,
-            "date": news.get("date", ""),
-            "severity": reco.get("severity", "medium").lower(),
-            "tag": ", ".join(reco.get("tags", [])),
-            "title": news.get("title", ""),
-            "newsTitle": news.get("title", ""),
-            "newsBody": news.get("summary", "")[:300] + "...",  # truncate
+            "date": news.date,
+            "severity": reco.severity.lower(),
+            "tag": ", ".join(reco.tags),
+            "title": news.title,
+            "newsTitle": news.title,
+            "newsBody": news.summary[:300] + "...",  # truncate
             "recSummary": recos[0] if recos else "Review the incident and assess relevance.",
             "recWho": rec_who,
             "recRisk": rec_risk,
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""Offline CVE enrichment from local NVD / KEV / EPSS mirrors.
+
+``python bot/enrich.py`` streams the mirrors below into ``data/cve_index.bin``:
+
+* ``data/nvd/*.json[.gz]``  NVD CVE dumps (API 2.0 or legacy 1.1 feeds)
+* ``data/kev.json``         CISA Known Exploited Vulnerabilities catalog
+* ``data/epss.csv[.gz]``    FIRST EPSS scores (cve,epss,percentile)
+
+The dumps are never loaded whole: array items are decoded one at a time,
+so ingest memory tracks the number of distinct CVEs, not the file sizes.
+The index is columnar (sorted uint64 keys, then cvss/epss/flag columns),
+so ``CveIndex`` memory-maps it and looks ids up with a bisection.
+
+The mirrors and the index are git-ignored. In the security-bot workflow
+they are kept in the Actions cache, refreshed once a day, and the index
+is rebuilt before ``bot/main.py`` runs.
+"""
+import csv
+import gzip
+import json
+import mmap
+import re
+import struct
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+
+NVD_DIR = Path("data/nvd")
+KEV_FILE = Path("data/kev.json")
+EPSS_FILES = [Path("data/epss.csv"), Path("data/epss.csv.gz")]
+INDEX_FILE = Path("data/cve_index.bin")
+
+MAGIC = b"CVEIDX01"
+HEADER = struct.Struct("<8sQ")
+UNKNOWN = 0xFFFF
+FLAG_KEV = 1
+CHUNK_SIZE = 1 << 20
+
+CVE_RE = re.compile(r"\bCVE-(\d{4})-(\d{4,})\b", re.IGNORECASE)
+
+
+def cve_key(cve_id):
+    m = CVE_RE.fullmatch(cve_id.strip())
+    if not m:
+        return None
+    return int(m.group(1)) * 100_000_000 + int(m.group(2))
+
+
+def key_to_cve(key):
+    year, num = divmod(key, 100_000_000)
+    return f"CVE-{year}-{num:04d}"
+
+
+def find_cves(text):
+    """Return the distinct CVE ids mentioned in text, in order of appearance."""
+    seen = []
+    for m in CVE_RE.finditer(text):
+        cve_id = f"CVE-{m.group(1)}-{m.group(2)}"
+        if cve_id not in seen:
+            seen.append(cve_id)
+    return seen
+
+
+def open_text(path):
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    return path.open(encoding="utf-8")
+
+
+def iter_json_array(path, key):
+    """Yield the items of the first ``"key": [...]`` array in a JSON file."""
+    decoder = json.JSONDecoder()
+    start_re = re.compile(r'"' + re.escape(key) + r'"\s*:\s*\[')
+
+    with open_text(path) as f:
+        buf = ""
+        while True:
+            m = start_re.search(buf)
+            if m:
+                buf = buf[m.end():]
+                break
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                return
+            # Keep a tail in case the key straddles two chunks
+            buf = buf[-(len(key) + 64):] + chunk
+
+        pos = 0
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n,":
+                pos += 1
+            if pos < len(buf) and buf[pos] == "]":
+                return
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+                # A number ending exactly at the chunk edge may continue
+                # in the next chunk; read on before trusting it
+                if end == len(buf) and not isinstance(item, (dict, list, str)):
+                    raise json.JSONDecodeError("value may be cut", buf, end)
+            except json.JSONDecodeError:
+                chunk = f.read(CHUNK_SIZE)
+                if not chunk:
+                    if buf[pos:].strip():
+                        raise
+                    return
+                buf = buf[pos:] + chunk
+                pos = 0
+                continue
+            yield item
+            pos = end
+
+
+def nvd_score(item):
+    """Return (cve_id, best CVSS base score or None) for one NVD record."""
+    if "cve" in item and "id" in item["cve"]:
+        # API 2.0 format
+        cve = item["cve"]
+        metrics = cve.get("metrics", {})
+        for name in ("cvssMetricV40", "cvssMetricV31", "cvssMetricV30", "cvssMetricV2"):
+            entries = metrics.get(name) or []
+            # Primary (NVD) score first, then any secondary source
+            entries = sorted(entries, key=lambda e: e.get("type") != "Primary")
+            for entry in entries:
+                score = (entry.get("cvssData") or {}).get("baseScore")
+                if score is not None:
+                    return cve["id"], score
+        return cve["id"], None
+
+    # Legacy 1.1 feed format
+    cve_id = item.get("cve", {}).get("CVE_data_meta", {}).get("ID", "")
+    impact = item.get("impact", {})
+    for metric, data in (("baseMetricV3", "cvssV3"), ("baseMetricV2", "cvssV2")):
+        score = ((impact.get(metric) or {}).get(data) or {}).get("baseScore")
+        if score is not None:
+            return cve_id, score
+    return cve_id, None
+
+
+class IndexBuilder:
+    """Accumulate per-CVE fields in compact parallel arrays."""
+
+    def __init__(self):
+        self.slots = {}  # cve key -> row in the arrays below
+        self.cvss = array("H")
+        self.epss = array("H")
+        self.flags = array("B")
+
+    def row(self, cve_id):
+        key = cve_key(cve_id)
+        if key is None:
+            return None
+        slot = self.slots.get(key)
+        if slot is None:
+            slot = self.slots[key] = len(self.flags)
+            self.cvss.append(UNKNOWN)
+            self.epss.append(UNKNOWN)
+            self.flags.append(0)
+        return slot
+
+    def add_nvd(self, path):
+        with open_text(path) as f:
+            head = f.read(4096)
+        key = "CVE_Items" if '"CVE_Items"' in head else "vulnerabilities"
+
+        count = 0
+        for item in iter_json_array(path, key):
+            cve_id, score = nvd_score(item)
+            slot = self.row(cve_id)
+            if slot is not None and score is not None:
+                self.cvss[slot] = int(round(float(score) * 10))
+            count += 1
+        return count
+
+    def add_kev(self, path):
+        count = 0
+        for item in iter_json_array(path, "vulnerabilities"):
+            slot = self.row(item.get("cveID", ""))
+            if slot is not None:
+                self.flags[slot] |= FLAG_KEV
+                count += 1
+        return count
+
+    def add_epss(self, path):
+        count = 0
+        with open_text(path) as f:
+            lines = (line for line in f if not line.startswith("#"))
+            for rec in csv.DictReader(lines):
+                slot = self.row(rec.get("cve", ""))
+                if slot is None:
+                    continue
+                try:
+                    self.epss[slot] = int(round(float(rec["epss"]) * 10000))
+                except (KeyError, ValueError):
+                    continue
+                count += 1
+        return count
+
+    def write(self, path):
+        keys = array("Q", sorted(self.slots))
+        order = [self.slots[k] for k in keys]
+        cvss = array("H", (self.cvss[i] for i in order))
+        epss = array("H", (self.epss[i] for i in order))
+        flags = array("B", (self.flags[i] for i in order))
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with tmp.open("wb") as f:
+            f.write(HEADER.pack(MAGIC, len(keys)))
+            # Widest column first keeps every column naturally aligned
+            for column in (keys, cvss, epss, flags):
+                column.tofile(f)
+        tmp.replace(path)
+        return len(keys)
+
+
+class CveIndex:
+    """Read-only memory-mapped view of ``cve_index.bin``."""
+
+    def __init__(self, path=INDEX_FILE):
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a CVE index")
+
+        view = memoryview(self._mm)
+        off = HEADER.size
+        self.keys = view[off:off + 8 * count].cast("Q")
+        off += 8 * count
+        self.cvss = view[off:off + 2 * count].cast("H")
+        off += 2 * count
+        self.epss = view[off:off + 2 * count].cast("H")
+        off += 2 * count
+        self.flags = view[off:off + count]
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def lookup(self, cve_id):
+        """Return {"id", "cvss", "epss", "kev"} or None if the id is unknown."""
+        key = cve_key(cve_id)
+        if key is None:
+            return None
+        i = bisect_left(self.keys, key)
+        if i == self.count or self.keys[i] != key:
+            return None
+        cvss = self.cvss[i]
+        epss = self.epss[i]
+        return {
+            "id": key_to_cve(key),
+            "cvss": None if cvss == UNKNOWN else cvss / 10,
+            "epss": None if epss == UNKNOWN else epss / 10000,
+            "kev": bool(self.flags[i] & FLAG_KEV),
+        }
+
+    def enrich(self, text):
+        """Look up every CVE id mentioned in text, skipping unknown ones."""
+        found = (self.lookup(cve_id) for cve_id in find_cves(text))
+        return [rec for rec in found if rec]
+
+
+def load_index(path=INDEX_FILE):
+    """Return a CveIndex, or None if the index has not been built."""
+    if not path.exists():
+        return None
+    return CveIndex(path)
+
+
+def main():
+    builder = IndexBuilder()
+
+    for path in sorted(NVD_DIR.glob("*.json")) + sorted(NVD_DIR.glob("*.json.gz")):
+        print(f"[+] NVD {path}: {builder.add_nvd(path)} records")
+    if KEV_FILE.exists():
+        print(f"[+] KEV {KEV_FILE}: {builder.add_kev(KEV_FILE)} records")
+    for path in EPSS_FILES:
+        if path.exists():
+            print(f"[+] EPSS {path}: {builder.add_epss(path)} records")
+
+    if not builder.slots:
+        print("No NVD/KEV/EPSS data found, exiting.")
+        return
+
+    count = builder.write(INDEX_FILE)
+    print(f"Wrote {count} CVEs to {INDEX_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,8 @@ import json
 from pathlib import Path
 from datetime import datetime, timedelta
 
+from models import Recommendation, load_items
+
 RECO_FILE = Path("docs/security_recommendations.json")
 FEED_FILE = Path("docs/recommendations_feed.json")
 
@@ -12,20 +14,19 @@ def main():
         print("No recommendations file, exiting.")
         return
 
-    data = json.loads(RECO_FILE.read_text(encoding="utf-8"))
-    items = data.get("items", [])
+    _, items = load_items(RECO_FILE, Recommendation)
 
     # Only High/Medium items from last 3 days
     cutoff = datetime.utcnow() - timedelta(days=3)
     out_items = []
 
     for item in items:
-        severity = item.get("severity", "Low")
-        if severity == "Low":
+        severity = item.severity
+        if not item.id or severity == "Low":
             continue
 
         # parse date (YYYY-MM-DD), fallback to very old
-        raw_date = item.get("date", "1970-01-01")
+        raw_date = item.date or "1970-01-01"
         try:
             dt = datetime.fromisoformat(raw_date)
         except Exception:
@@ -36,15 +37,16 @@ def main():
 
         out_items.append(
             {
-                "id": item.get("id"),
+                "id": item.id,
                 "date": raw_date,
-                "title": item.get("title", ""),
-                "url": item.get("url", ""),
-                "source": item.get("source", ""),
+                "title": item.title,
+                "url": item.url,
+                "source": item.source,
                 "severity": severity,
-                "tags": item.get("tags", []),
-                "tech": item.get("tech", []),
-                "top_recommendations": item.get("recommendations", [])[:2],
+                "tags": list(item.tags),
+                "tech": list(item.tech),
+                "cves": item.cves,
+                "top_recommendations": item.recommendations[:2],
             }
         )
 
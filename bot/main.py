@@ -3,6 +3,11 @@ import json
 from pathlib import Path
 from datetime import datetime
 
+from assets import load_inventory, match_article, save_affected_assets
+from enrich import load_index
+from models import Article, Recommendation, dump_items, intern_tags, load_items
+from snapshot import write_snapshot
+
 NEWS_FILE = Path("docs/news.json")
 SEEN_FILE = Path("data/seen_articles.json")
 RECO_FILE = Path("docs/security_recommendations.json")
@@ -11,8 +16,7 @@ RECO_FILE = Path("docs/security_recommendations.json")
 def load_news():
     if not NEWS_FILE.exists():
         return []
-    data = json.loads(NEWS_FILE.read_text(encoding="utf-8"))
-    return data.get("items", [])
+    return load_items(NEWS_FILE, Article)[1]
 
 
 def load_seen():
@@ -31,8 +35,8 @@ def save_seen(seen_ids):
 
 def load_existing_recos():
     if RECO_FILE.exists():
-        return json.loads(RECO_FILE.read_text(encoding="utf-8"))
-    return {"lastUpdated": "", "items": []}
+        return load_items(RECO_FILE, Recommendation)
+    return {"lastUpdated": "", "items": []}, []
 
 
 def classify_stack(text: str):
@@ -61,16 +65,35 @@ def classify_stack(text: str):
     return tech
 
 
-def compute_severity(security_tags):
-    if "Ransomware" in security_tags or "Data breach" in security_tags:
+SEVERITY_ORDER = ["Low", "Medium", "High", "Critical"]
+
+
+def cve_severity(cve):
+    if cve["kev"] or (cve["cvss"] or 0) >= 9.0:
+        return "Critical"
+    if (cve["cvss"] or 0) >= 7.0 or (cve["epss"] or 0) >= 0.1:
         return "High"
-    if "Vulnerability" in security_tags or "Account takeover" in security_tags:
+    if (cve["cvss"] or 0) >= 4.0:
         return "Medium"
     return "Low"
 
 
+def compute_severity(security_tags, cves=()):
+    if "Ransomware" in security_tags or "Data breach" in security_tags:
+        severity = "High"
+    elif "Vulnerability" in security_tags or "Account takeover" in security_tags:
+        severity = "Medium"
+    else:
+        severity = "Low"
+
+    # Known CVE scores can only raise the tag-based estimate
+    for cve in cves:
+        severity = max(severity, cve_severity(cve), key=SEVERITY_ORDER.index)
+    return severity
+
+
 def build_scripts(article, tech_tags, security_tags):
-    url = article.get("url", "")
+    url = article.url
     scripts = []
 
     # Ransomware / Malware / Data breach
@@ -97,6 +120,10 @@ Get-CimInstance Win32_StartupCommand |
 ps aux | egrep "crypto|minerd|xmrig|kdevtmpfsi" | grep -v egrep || echo "No obvious miners found"
 
 find / -xdev -type f -perm -4000 2>/dev/null
+
+# Or run every Linux check in one parallel filesystem pass with JSON output
+# (hunt_agent.py from the Cyber Radar scripts directory):
+# python3 hunt_agent.py -o hunt-report.json
 """.strip(),
             }
         )
@@ -175,10 +202,38 @@ grep -Ei "PATTERN" /var/log/* 2>/dev/null || echo "No hits for pattern"
     return scripts
 
 
-def build_recommendations(article):
-    text = f"{article['title']} {article.get('summary', '')}".lower()
-    security_tags = article.get("tags", [])
-    tech_tags = classify_stack(text)
+def build_inventory_report(article, match):
+    """Private per-article entry for data/affected_assets.json.
+
+    Everything derived from the asset inventory (relevance, counts, host
+    names, inventory-specific advice) goes here and never into docs/, which
+    is the public Pages site.
+    """
+    if match["affectedCount"]:
+        advice = (
+            f"Patch or mitigate the {match['affectedCount']} deployed asset(s) from the asset inventory "
+            "that match this advisory."
+        )
+    else:
+        advice = (
+            "The article names an inventory vendor or product, but no deployed version is in the affected "
+            "range; confirm and close."
+        )
+    return {
+        "title": article.title,
+        "relevance": match["relevance"],
+        "affectedCount": match["affectedCount"],
+        "advice": advice,
+        "affectedAssets": match["affectedAssets"],
+    }
+
+
+def build_recommendations(article, cve_index=None):
+    raw_text = article.text
+    text = raw_text.lower()
+    security_tags = article.tags
+    tech_tags = intern_tags(classify_stack(text))
+    cves = cve_index.enrich(raw_text) if cve_index else []
 
     recos = []
 
@@ -210,6 +265,14 @@ def build_recommendations(article):
             ]
         )
 
+    # Actively exploited CVEs
+    kev_ids = [c["id"] for c in cves if c["kev"]]
+    if kev_ids:
+        recos.insert(
+            0,
+            f"Patch {', '.join(kev_ids)} ahead of the normal cycle: listed in CISA KEV as exploited in the wild.",
+        )
+
     # Data breach
     if "Data breach" in security_tags:
         recos.extend(
@@ -251,21 +314,22 @@ def build_recommendations(article):
         )
 
     scripts = build_scripts(article, tech_tags, security_tags)
-    severity = compute_severity(security_tags)
-
-    return {
-        "id": article["id"],
-        "date": article["date"],
-        "title": article["title"],
-        "url": article.get("url", ""),
-        "source": article.get("source", ""),
-        "summary": article.get("summary", ""),
-        "tags": security_tags,
-        "tech": tech_tags,
-        "severity": severity,
-        "recommendations": recos,
-        "scripts": scripts,
-    }
+    severity = compute_severity(security_tags, cves)
+
+    return Recommendation(
+        id=article.id,
+        date=article.date,
+        title=article.title,
+        url=article.url,
+        source=article.source,
+        summary=article.summary,
+        tags=security_tags,
+        tech=tech_tags,
+        severity=severity,
+        cves=cves,
+        recommendations=recos,
+        scripts=scripts,
+    )
 
 
 def main():
@@ -275,32 +339,39 @@ def main():
         return
 
     seen = load_seen()
-    existing = load_existing_recos()
-    items = existing.get("items", [])
+    inventory = load_inventory()
+    cve_index = load_index()
+    existing, items = load_existing_recos()
+    inventory_report = {}
 
     new_count = 0
     for article in news:
-        if article["id"] in seen:
+        if not article.id or article.id in seen:
             continue
-        rec = build_recommendations(article)
+        match = match_article(inventory, article.text) if inventory else None
+        if match and match["relevance"]:
+            inventory_report[article.id] = build_inventory_report(article, match)
+        rec = build_recommendations(article, cve_index)
         items.insert(0, rec)
-        seen.add(article["id"])
+        seen.add(article.id)
         new_count += 1
-        print(f"[+] Added recommendations for: {article['title'][:80]}")
+        print(f"[+] Added recommendations for: {article.title[:80]}")
 
     if new_count == 0:
         print("No new articles to process.")
         return
 
-    existing["items"] = items[:200]
     existing["lastUpdated"] = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
-
-    RECO_FILE.parent.mkdir(parents=True, exist_ok=True)
-    RECO_FILE.write_text(
-        json.dumps(existing, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    items = items[:200]
+    dump_items(RECO_FILE, existing, items)
     save_seen(seen)
+    save_affected_assets(inventory_report, {item.id for item in items})
+    # The snapshot is derived from the JSON archive: a failure here must not
+    # leave the archive and seen list out of step
+    try:
+        write_snapshot(items)
+    except Exception as e:
+        print(f"  Warning: could not write archive snapshot: {e}")
     print(f"Updated {RECO_FILE} with {new_count} items.")
 
 
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Shared article / recommendation model used by every pipeline stage.
+
+Both classes are slotted dataclasses, and tag / tech lists are interned
+into shared tuples, so an archive of mostly repeated tag combinations
+costs one small object per item instead of a dict plus a list each.
+``from_dict`` also accepts the legacy field names still found in older
+files (``description`` for ``summary``, comma-joined ``tag`` for ``tags``)
+and treats missing or null fields as empty, so one bad record cannot stop
+a stage; items without an id decode with ``id == ""`` for callers to skip.
+"""
+import json
+import sys
+from dataclasses import dataclass, field
+
+# Known vocabularies; anything else is still accepted and interned
+TAGS = (
+    "Phishing", "Malware", "Ransomware", "Vulnerability", "Data breach",
+    "Steam", "Gaming", "Cheats", "Account takeover", "Cybersecurity",
+)
+TECH = (
+    "Windows", "Linux", "WebServer", "VMware", "Cloud", "M365",
+    "Telecom", "ICS/OT", "Generic",
+)
+SEVERITIES = ("Low", "Medium", "High", "Critical")
+
+_TAG_SETS = {}
+
+
+def intern_tags(tags):
+    """Return a shared tuple of interned strings for a tag list."""
+    if isinstance(tags, str):
+        tags = [t.strip() for t in tags.split(",") if t.strip()]
+    key = tuple(tags)
+    cached = _TAG_SETS.get(key)
+    if cached is None:
+        cached = _TAG_SETS[key] = tuple(sys.intern(t) for t in key)
+    return cached
+
+
+for _vocab in (TAGS, TECH, SEVERITIES):
+    for _name in _vocab:
+        intern_tags((_name,))
+
+
+@dataclass(slots=True)
+class Article:
+    id: str
+    date: str
+    title: str
+    summary: str = ""
+    url: str = ""
+    source: str = ""
+    tags: tuple = ()
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(
+            d.get("id") or "",
+            d.get("date") or "",
+            d.get("title") or "",
+            d.get("summary") or d.get("description") or "",
+            d.get("url") or "",
+            sys.intern(d.get("source") or ""),
+            intern_tags(d.get("tags") or d.get("tag") or ()),
+        )
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "date": self.date,
+            "title": self.title,
+            "summary": self.summary,
+            "url": self.url,
+            "source": self.source,
+            "tags": list(self.tags),
+        }
+
+    @property
+    def text(self):
+        return f"{self.title} {self.summary}"
+
+
+@dataclass(slots=True)
+class Recommendation:
+    id: str
+    date: str
+    title: str
+    url: str = ""
+    source: str = ""
+    summary: str = ""
+    tags: tuple = ()
+    tech: tuple = ()
+    severity: str = "Low"
+    cves: list = field(default_factory=list)
+    recommendations: list = field(default_factory=list)
+    scripts: list = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(
+            d.get("id") or "",
+            d.get("date") or "",
+            d.get("title") or "",
+            d.get("url") or "",
+            sys.intern(d.get("source") or ""),
+            d.get("summary") or d.get("description") or "",
+            intern_tags(d.get("tags") or d.get("tag") or ()),
+            intern_tags(d.get("tech") or ()),
+            sys.intern(d.get("severity") or "Low"),
+            d.get("cves") or [],
+            d.get("recommendations") or [],
+            d.get("scripts") or [],
+        )
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "date": self.date,
+            "title": self.title,
+            "url": self.url,
+            "source": self.source,
+            "summary": self.summary,
+            "tags": list(self.tags),
+            "tech": list(self.tech),
+            "severity": self.severity,
+            "cves": self.cves,
+            "recommendations": self.recommendations,
+            "scripts": self.scripts,
+        }
+
+
+def load_items(path, cls):
+    """Read ``{"items": [...]}`` from path and decode every item as cls."""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return data, [cls.from_dict(d) for d in data.get("items", [])]
+
+
+def dump_items(path, data, items):
+    """Write data back to path with ``items`` re-encoded from the models."""
+    data["items"] = [item.to_dict() for item in items]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""Pre-render the news / recommendations pages from docs/data/feed.json.
+
+Cards are written between the ``<!-- prerender:start -->`` and
+``<!-- prerender:end -->`` markers of docs/news.html and
+docs/recommendations.html, so the pages paint without waiting for the
+client-side script, which now only runs when no cards are present. Every
+feed item also gets a detail page under docs/items/.
+
+data/render_manifest.json keeps a hash of the inputs of every generated
+page; a page is only rewritten when its hash changed or the file is gone.
+Detail pages of items that are no longer in the feed are deleted.
+"""
+import hashlib
+import json
+import re
+from html import escape
+from pathlib import Path
+
+from models import Recommendation
+
+FEED_FILE = Path("docs/data/feed.json")
+NEWS_PAGE = Path("docs/news.html")
+RECO_PAGE = Path("docs/recommendations.html")
+ITEMS_DIR = Path("docs/items")
+MANIFEST_FILE = Path("data/render_manifest.json")
+
+# Bump when the markup below changes so every page is regenerated once
+RENDER_VERSION = 1
+
+PRERENDER_RE = re.compile(r"(<!-- prerender:start -->).*?(<!-- prerender:end -->)", re.DOTALL)
+
+# Structured recommendation fields written by bot/build_feed.py
+SECTIONS = [
+    ("recWho", "Who is affected"),
+    ("recRisk", "Risk"),
+    ("recActions0_24", "Actions: first 24 hours"),
+    ("recActions24_72", "Actions: 24–72 hours"),
+    ("recDetection", "Detection"),
+]
+
+DETAIL_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8" />
+  <title>{title} – Cyber Radar</title>
+  <meta name="viewport" content="width=device-width, initial-scale=1" />
+  <link rel="stylesheet" href="../theme.css" />
+</head>
+<body>
+  <header>
+    <div class="header-content">
+      <a href="../index.html" class="logo">🛡️ Cyber Radar</a>
+      <nav>
+        <a href="../news.html">News</a>
+        <a href="../recommendations.html">Recommendations</a>
+      </nav>
+    </div>
+  </header>
+
+  <main class="container" style="max-width: 900px; margin: 3rem auto; padding: 0 1rem;">
+{body}
+  </main>
+</body>
+</html>
+"""
+
+
+def load_feed():
+    """Return feed items as (Recommendation, raw dict) pairs."""
+    if not FEED_FILE.exists():
+        return []
+    data = json.loads(FEED_FILE.read_text(encoding="utf-8"))
+    # scripts/build_feed.py writes {"items": [...]}, bot/build_feed.py a bare list
+    raw_items = data.get("items", []) if isinstance(data, dict) else data
+    return [(Recommendation.from_dict(d), d) for d in raw_items if d.get("id")]
+
+
+def item_hash(raw):
+    payload = json.dumps([RENDER_VERSION, raw], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def page_name(item):
+    return re.sub(r"[^\w.-]", "_", item.id) + ".html"
+
+
+def detail_href(item):
+    return f"{ITEMS_DIR.name}/{page_name(item)}"
+
+
+def render_news_card(item):
+    tags = "".join(f'<span class="tag">{escape(t)}</span>' for t in item.tags)
+    return f"""
+            <article class="news-card">
+                <h2 class="news-title"><a href="{detail_href(item)}">{escape(item.title or "(no title)")}</a></h2>
+                <div class="news-meta">
+                    <span>{escape(item.date)}</span>
+                    <span>{escape(item.source)}</span>
+                    {tags}
+                </div>
+                <p class="news-body">{escape(item.summary)}</p>
+            </article>"""
+
+
+def render_reco_card(item, raw):
+    severity = item.severity.lower()
+    tags = "".join(f'<span class="rec-tag">{escape(t)}</span>' for t in item.tags)
+    return f"""
+      <section class="recommendation-card">
+        <div class="rec-meta">
+          <span class="rec-source">{escape(item.source or "Unknown")}</span>
+          <span class="rec-date">{escape(item.date)}</span>
+          <span class="rec-severity {escape(severity, quote=True)}">{escape(severity.upper())}</span>
+          <span class="rec-tag">{escape(raw.get("category", ""))}</span>
+        </div>
+        <h2 class="rec-title"><a class="rec-link" href="{detail_href(item)}">{escape(item.title or "(no title)")}</a></h2>
+        <p class="rec-summary">{escape(item.summary)}</p>
+        <div class="rec-meta">{tags}</div>
+        <div class="rec-foot">
+          <span class="rec-id">ID: {escape(item.id)}</span>
+          <span class="rec-status">Updated: {escape(item.date)}</span>
+        </div>
+      </section>"""
+
+
+def render_detail(item, raw):
+    parts = [
+        f'    <h1 style="color:#fff;">{escape(item.title or "(no title)")}</h1>',
+        f'    <p style="color:#94a3b8;">{escape(item.date)} · {escape(item.source)} · '
+        f'{escape(item.severity.upper())} · {escape(", ".join(item.tags))}</p>',
+        f"    <p>{escape(item.summary)}</p>",
+    ]
+    if raw.get("recSummary"):
+        parts.append(f"    <p><strong>{escape(raw['recSummary'])}</strong></p>")
+    for key, heading in SECTIONS:
+        entries = raw.get(key) or []
+        if entries:
+            lis = "".join(f"<li>{escape(e)}</li>" for e in entries)
+            parts.append(f"    <h3>{escape(heading)}</h3>\n    <ul>{lis}</ul>")
+    if item.url:
+        parts.append(f'    <p><a class="btn-action" href="{escape(item.url, quote=True)}">Read the original article</a></p>')
+    return DETAIL_TEMPLATE.format(title=escape(item.title), body="\n".join(parts))
+
+
+def fill_template(page, cards):
+    html = page.read_text(encoding="utf-8")
+    if not PRERENDER_RE.search(html):
+        print(f"  {page} has no prerender markers, skipped")
+        return False
+    html = PRERENDER_RE.sub(lambda m: m.group(1) + "".join(cards) + "\n        " + m.group(2), html, count=1)
+    page.write_text(html, encoding="utf-8")
+    return True
+
+
+def prune_stale(manifest, items):
+    """Delete detail pages (and their manifest keys) of items not in the feed."""
+    current = {str(ITEMS_DIR / page_name(item)) for item, _ in items}
+    removed = 0
+    for page in ITEMS_DIR.glob("*.html"):
+        if str(page) not in current:
+            page.unlink()
+            removed += 1
+    items_prefix = str(ITEMS_DIR) + "/"
+    for key in [k for k in manifest if k.startswith(items_prefix) and k not in current]:
+        del manifest[key]
+    return removed
+
+
+def save_manifest(manifest):
+    MANIFEST_FILE.parent.mkdir(parents=True, exist_ok=True)
+    MANIFEST_FILE.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def main():
+    manifest = {}
+    if MANIFEST_FILE.exists():
+        manifest = json.loads(MANIFEST_FILE.read_text(encoding="utf-8"))
+
+    items = load_feed()
+    if not items:
+        removed = prune_stale(manifest, items)
+        save_manifest(manifest)
+        print(f"No feed items, nothing to render, removed {removed} stale")
+        return
+
+    hashes = {item.id: item_hash(raw) for item, raw in items}
+    rendered = 0
+
+    ITEMS_DIR.mkdir(parents=True, exist_ok=True)
+    for item, raw in items:
+        page = ITEMS_DIR / page_name(item)
+        if manifest.get(str(page)) == hashes[item.id] and page.exists():
+            continue
+        page.write_text(render_detail(item, raw), encoding="utf-8")
+        manifest[str(page)] = hashes[item.id]
+        rendered += 1
+
+    # List pages depend on every item and on the order of the feed
+    list_hash = hashlib.sha256("".join(hashes[item.id] for item, _ in items).encode()).hexdigest()
+    for page, render in (
+        (NEWS_PAGE, lambda: [render_news_card(item) for item, _ in items]),
+        (RECO_PAGE, lambda: [render_reco_card(item, raw) for item, raw in items]),
+    ):
+        if manifest.get(str(page)) == list_hash or not page.exists():
+            continue
+        if fill_template(page, render()):
+            manifest[str(page)] = list_hash
+            rendered += 1
+
+    removed = prune_stale(manifest, items)
+    save_manifest(manifest)
+    print(f"Rendered {rendered} changed page(s) for {len(items)} feed items, removed {removed} stale")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""Columnar binary snapshot of the recommendations archive.
+
+``bot/main.py`` rewrites ``data/archive.snap`` next to the JSON archive.
+Tools that only need history (analytics, search rebuilds, backfills) can
+memory-map it and read single columns without decoding any JSON item.
+The file is derived and git-ignored; where it is missing, rebuild it.
+
+Layout: an 8-byte magic, a uint32 header length and a small JSON header
+holding column offsets and the tag / tech / source / severity
+dictionaries, followed by 8-byte aligned columns:
+
+* ``id``        fixed-width UTF-8 (width in bytes), NUL padded
+* ``date``      int32 days since 1970-01-01 (-1 if unparsable)
+* ``severity``  uint8 dictionary code
+* ``source``    uint16 dictionary code
+* ``tags``, ``tech``  uint32 row offsets + uint16 dictionary codes
+* ``title``, ``url``, ``summary``  uint32 row offsets + UTF-8 heap
+
+Run ``python bot/snapshot.py`` to rebuild it from the JSON archive.
+"""
+import json
+import mmap
+import struct
+from array import array
+from datetime import date
+from pathlib import Path
+
+from models import SEVERITIES, Recommendation, load_items
+
+RECO_FILE = Path("docs/security_recommendations.json")
+SNAPSHOT_FILE = Path("data/archive.snap")
+
+MAGIC = b"CRSNAP01"
+PREFIX = struct.Struct("<8sI")
+EPOCH = date(1970, 1, 1).toordinal()
+
+TEXT_COLUMNS = ("title", "url", "summary")
+LIST_COLUMNS = ("tags", "tech")
+
+
+def date_to_days(raw):
+    try:
+        return date.fromisoformat(raw[:10]).toordinal() - EPOCH
+    except (TypeError, ValueError):
+        return -1
+
+
+def days_to_date(days):
+    return "" if days < 0 else date.fromordinal(days + EPOCH).isoformat()
+
+
+def _encode_codes(values, vocab):
+    codes = {v: i for i, v in enumerate(vocab)}
+    out = array("H")
+    for v in values:
+        if v not in codes:
+            codes[v] = len(vocab)
+            vocab.append(v)
+        out.append(codes[v])
+    return out
+
+
+def write_snapshot(items, path=SNAPSHOT_FILE):
+    """Write Recommendation items to path as a columnar snapshot."""
+    n = len(items)
+    ids = [item.id.encode("utf-8") for item in items]
+    id_width = max((len(raw) for raw in ids), default=1)
+    columns = {}
+    header = {"rows": n, "idWidth": id_width, "columns": {}, "dicts": {}}
+
+    columns["id"] = b"".join(raw.ljust(id_width, b"\0") for raw in ids)
+    columns["date"] = array("i", (date_to_days(item.date) for item in items))
+
+    severities = list(SEVERITIES)
+    columns["severity"] = array("B", _encode_codes((item.severity for item in items), severities))
+    sources = []
+    columns["source"] = _encode_codes((item.source for item in items), sources)
+    header["dicts"].update(severity=severities, source=sources)
+
+    for name in LIST_COLUMNS:
+        vocab = []
+        offsets = array("I", [0])
+        flat = []
+        for item in items:
+            flat.extend(getattr(item, name))
+            offsets.append(len(flat))
+        columns[name + ".offsets"] = offsets
+        columns[name] = _encode_codes(flat, vocab)
+        header["dicts"][name] = vocab
+
+    for name in TEXT_COLUMNS:
+        offsets = array("I", [0])
+        heap = bytearray()
+        for item in items:
+            heap += getattr(item, name).encode("utf-8")
+            offsets.append(len(heap))
+        columns[name + ".offsets"] = offsets
+        columns[name] = bytes(heap)
+
+    # Column offsets are relative to the end of the header, so compute
+    # them first and only then serialize the header that contains them
+    pos = 0
+    for name, col in columns.items():
+        raw = col.tobytes() if isinstance(col, array) else col
+        columns[name] = raw
+        header["columns"][name] = [pos, len(raw), col.typecode if isinstance(col, array) else "B"]
+        pos += len(raw) + (-len(raw) % 8)
+
+    header_raw = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    header_raw += b" " * (-(PREFIX.size + len(header_raw)) % 8)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with tmp.open("wb") as f:
+        f.write(PREFIX.pack(MAGIC, len(header_raw)))
+        f.write(header_raw)
+        for raw in columns.values():
+            f.write(raw)
+            f.write(b"\0" * (-len(raw) % 8))
+    tmp.replace(path)
+    return n
+
+
+class Snapshot:
+    """Memory-mapped reader; columns are decoded lazily and only on request.
+
+    Use it as a context manager or call close(). Views returned by raw()
+    must be released before closing.
+    """
+
+    def __init__(self, path=SNAPSHOT_FILE):
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, header_len = PREFIX.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an archive snapshot")
+        self.header = json.loads(self._mm[PREFIX.size:PREFIX.size + header_len])
+        self.rows = self.header["rows"]
+        self.dicts = self.header["dicts"]
+        self._base = PREFIX.size + header_len
+        self._view = memoryview(self._mm)
+
+    def __len__(self):
+        return self.rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._file.closed:
+            return
+        self._view.release()
+        self._mm.close()
+        self._file.close()
+
+    def raw(self, name):
+        """Return a column as a zero-copy memoryview of its element type."""
+        offset, length, typecode = self.header["columns"][name]
+        start = self._base + offset
+        return self._view[start:start + length].cast(typecode)
+
+    def ids(self):
+        width = self.header["idWidth"]
+        col = self.raw("id")
+        return [bytes(col[i:i + width]).rstrip(b"\0").decode("utf-8") for i in range(0, len(col), width)]
+
+    def dates(self):
+        return [days_to_date(d) for d in self.raw("date")]
+
+    def coded(self, name):
+        vocab = self.dicts[name]
+        return [vocab[c] for c in self.raw(name)]
+
+    def lists(self, name):
+        vocab = self.dicts[name]
+        offsets = self.raw(name + ".offsets")
+        codes = self.raw(name)
+        return [tuple(vocab[c] for c in codes[offsets[i]:offsets[i + 1]]) for i in range(self.rows)]
+
+    def text(self, name, row=None):
+        offsets = self.raw(name + ".offsets")
+        heap = self.raw(name)
+        if row is not None:
+            return str(heap[offsets[row]:offsets[row + 1]], "utf-8")
+        return [str(heap[offsets[i]:offsets[i + 1]], "utf-8") for i in range(self.rows)]
+
+    def column(self, name):
+        """Decode one column to a list of Python values."""
+        if name == "id":
+            return self.ids()
+        if name == "date":
+            return self.dates()
+        if name in LIST_COLUMNS:
+            return self.lists(name)
+        if name in TEXT_COLUMNS:
+            return self.text(name)
+        return self.coded(name)
+
+
+def load_snapshot(path=SNAPSHOT_FILE):
+    """Return a Snapshot, or None if none has been written yet."""
+    if not path.exists():
+        return None
+    return Snapshot(path)
+
+
+def main():
+    if not RECO_FILE.exists():
+        print("No recommendations file, exiting.")
+        return
+    _, items = load_items(RECO_FILE, Recommendation)
+    count = write_snapshot(items)
+    print(f"Wrote {count} rows to {SNAPSHOT_FILE}")
+
+
+if __name__ == "__main__":
+    main()
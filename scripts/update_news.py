@@ -2,9 +2,14 @@
 import feedparser
 import json
 import os
+import sys
 from datetime import datetime
+from pathlib import Path
 import hashlib
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "bot"))
+from models import Article, intern_tags
+
 # RSS feeds to monitor
 FEEDS = [
     {
@@ -59,21 +64,24 @@ def extract_tags(title, summary):
     return tags if tags else ['Cybersecurity']
 
 def load_existing_news():
-    """Load existing news.json"""
+    """Load existing news.json, decoding items as Article"""
     if os.path.exists(NEWS_FILE):
         with open(NEWS_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            data = json.load(f)
+        data['items'] = [Article.from_dict(d) for d in data.get('items', [])]
+        return data
     return {"lastUpdated": "", "items": []}
 
 def save_news(data):
     """Save news.json"""
+    data = dict(data, items=[item.to_dict() for item in data['items']])
     with open(NEWS_FILE, 'w', encoding='utf-8') as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
 
 def fetch_and_update():
     """Fetch RSS feeds and update news.json"""
     data = load_existing_news()
-    existing_ids = {item['id'] for item in data['items']}
+    existing_ids = {item.id for item in data['items']}
     new_count = 0
     
     for feed_info in FEEDS:
@@ -100,15 +108,15 @@ def fetch_and_update():
                     summary = summary[:197] + '...'
                 
                 # Create news item
-                news_item = {
-                    "id": item_id,
-                    "date": date_str,
-                    "title": entry.title,
-                    "summary": summary or entry.title,
-                    "url": entry.link,
-                    "source": feed_info['source'],
-                    "tags": extract_tags(entry.title, summary)
-                }
+                news_item = Article(
+                    id=item_id,
+                    date=date_str,
+                    title=entry.title,
+                    summary=summary or entry.title,
+                    url=entry.link,
+                    source=feed_info['source'],
+                    tags=intern_tags(extract_tags(entry.title, summary)),
+                )
                 
                 data['items'].insert(0, news_item)
                 existing_ids.add(item_id)
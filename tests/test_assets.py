@@ -0,0 +1,100 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "bot"))
+
+from assets import build_index, extract_version_ranges, load_inventory, match_article
+from main import build_inventory_report, build_recommendations
+from models import Article
+
+ROWS = [
+    {"asset": "web1", "vendor": "Apache", "product": "HTTP Server", "version": "2.4.58"},
+    {"asset": "web2", "vendor": "Apache", "product": "HTTP Server", "version": "2.4.57"},
+    {"asset": "ws1", "vendor": "Google", "product": "Chrome", "version": "120.0.6099.109"},
+    {"asset": "ws2", "vendor": "Google", "product": "Chrome", "version": "121.0.6167.85"},
+]
+
+
+def affected_hosts(text):
+    result = match_article(build_index(ROWS), text)
+    return result["relevance"], sorted(a["asset"] for a in result["affectedAssets"])
+
+
+def test_fixed_in_version_is_exclusive_upper_bound():
+    assert extract_version_ranges("flaw fixed in version 2.4.58, upgrade now") == [(None, (2, 4, 58), False)]
+    assert affected_hosts("Apache HTTP Server flaw fixed in version 2.4.58, upgrade now") == (100, ["web2"])
+
+
+def test_upgrade_to_and_patched_in():
+    assert extract_version_ranges("Users should upgrade to 2.4.58") == [(None, (2, 4, 58), False)]
+    assert extract_version_ranges("patched in v2.4.58") == [(None, (2, 4, 58), False)]
+
+
+def test_patched_host_is_not_affected():
+    relevance, hosts = affected_hosts("Apache HTTP Server bug patched in 2.4.57")
+    assert hosts == []
+    assert relevance < 60
+
+
+def test_version_at_end_of_sentence():
+    assert extract_version_ranges("Exploited in Apache 2.4.57.") == [((2, 4, 57), (2, 4, 57), True)]
+    assert extract_version_ranges("fixed in Apache 2.4.58.", ["Apache"]) == [(None, (2, 4, 58), False)]
+
+
+def test_single_component_version_after_product():
+    assert extract_version_ranges("Chrome 120 zero-day", ["Chrome"]) == [((120,), (120,), True)]
+    assert affected_hosts("Google Chrome 120 zero-day exploited") == (100, ["ws1"])
+    assert affected_hosts("Zero-day fixed in Chrome 121") == (100, ["ws1"])
+
+
+def test_counts_are_not_versions():
+    assert extract_version_ranges("600 firewalls breached in 5 weeks") == []
+
+
+def test_ranges_and_bounds():
+    assert extract_version_ranges("versions 2.4.50 to 2.4.57") == [((2, 4, 50), (2, 4, 57), True)]
+    assert extract_version_ranges("before 2.4.58") == [(None, (2, 4, 58), False)]
+    assert extract_version_ranges("2.4.57 and earlier") == [(None, (2, 4, 57), True)]
+    assert affected_hosts("Apache HTTP Server versions 2.4.50 to 2.4.57") == (100, ["web2"])
+
+
+def test_product_without_versions_matches_all_copies():
+    assert affected_hosts("New Apache HTTP Server attack campaign") == (60, ["web1", "web2"])
+
+
+def test_vendor_only_mention():
+    assert affected_hosts("Google announces new bug bounty") == (20, [])
+
+
+def test_version_of_another_product_is_ignored():
+    text = "Apache HTTP Server and OpenSSL 3.0.7 both affected by new flaw"
+    assert affected_hosts(text) == (60, ["web1", "web2"])
+    assert affected_hosts("Apache HTTP Server and OpenSSL versions 3.0.7 affected") == (60, ["web1", "web2"])
+
+
+def test_ipv4_address_is_not_a_version():
+    assert extract_version_ranges("Attackers hit 10.0.0.1 and 10.0.0.0/8") == []
+    assert affected_hosts("Attackers hit 10.0.0.1 running Apache HTTP Server") == (60, ["web1", "web2"])
+
+
+def test_fix_phrase_in_same_clause_applies():
+    assert affected_hosts("Apache HTTP Server bug affects versions before 2.4.58") == (100, ["web2"])
+    assert affected_hosts("OpenSSL 3.0.7 patched. Apache HTTP Server also hit") == (60, ["web1", "web2"])
+
+
+def test_csv_with_bom(tmp_path):
+    path = tmp_path / "assets.csv"
+    path.write_bytes(b"\xef\xbb\xbfvendor,product,version,asset\r\nApache,HTTP Server,2.4.57,web2\r\n")
+    index = load_inventory([path])
+    assert ("apache", "http server") in index["products"]
+
+
+def test_inventory_results_stay_out_of_public_recommendation():
+    article = Article("a1", "2026-02-22", "Apache HTTP Server 2.4.57 exploited", tags=("Vulnerability",))
+    match = match_article(build_index(ROWS), article.text)
+    public = build_recommendations(article).to_dict()
+    assert "web2" not in str(public)
+    assert "relevance" not in public and "affectedCount" not in public
+    report = build_inventory_report(article, match)
+    assert (report["relevance"], report["affectedCount"]) == (100, 1)
+    assert report["affectedAssets"][0]["asset"] == "web2"
@@ -0,0 +1,111 @@
+import gzip
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "bot"))
+
+import enrich
+from enrich import CveIndex, IndexBuilder, iter_json_array, nvd_score
+from main import compute_severity, cve_severity
+
+
+def test_falls_back_to_next_metric_family_without_score():
+    item = {"cve": {"id": "CVE-2024-1234", "metrics": {
+        "cvssMetricV40": [{"type": "Secondary", "cvssData": {"version": "4.0"}}],
+        "cvssMetricV31": [{"type": "Primary", "cvssData": {"baseScore": 9.8}}],
+    }}}
+    assert nvd_score(item) == ("CVE-2024-1234", 9.8)
+
+
+def test_prefers_primary_score():
+    item = {"cve": {"id": "CVE-2024-1234", "metrics": {"cvssMetricV31": [
+        {"type": "Secondary", "cvssData": {"baseScore": 5.0}},
+        {"type": "Primary", "cvssData": {"baseScore": 7.5}},
+    ]}}}
+    assert nvd_score(item) == ("CVE-2024-1234", 7.5)
+
+
+def test_legacy_feed_falls_back_to_v2():
+    item = {"cve": {"CVE_data_meta": {"ID": "CVE-2017-0144"}},
+            "impact": {"baseMetricV3": {"cvssV3": {}}, "baseMetricV2": {"cvssV2": {"baseScore": 9.3}}}}
+    assert nvd_score(item) == ("CVE-2017-0144", 9.3)
+
+
+def nvd_item(cve_id, score):
+    return {"cve": {"id": cve_id, "descriptions": [{"value": "x] " * 20}],
+                    "metrics": {"cvssMetricV31": [{"type": "Primary", "cvssData": {"baseScore": score}}]}}}
+
+
+def test_iter_json_array_across_small_chunks(tmp_path, monkeypatch):
+    # Every item, and the key itself, straddles several 7-character chunks
+    monkeypatch.setattr(enrich, "CHUNK_SIZE", 7)
+    items = [nvd_item(f"CVE-2024-{n:04d}", 5.0) for n in range(1, 6)]
+    path = tmp_path / "nvd.json.gz"
+    doc = {"format": "NVD_CVE", "pad": "y" * 50, "vulnerabilities": items, "after": [{"not": "an item"}]}
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump(doc, f, indent=1)
+    assert list(iter_json_array(path, "vulnerabilities")) == items
+
+
+def test_iter_json_array_edges(tmp_path, monkeypatch):
+    monkeypatch.setattr(enrich, "CHUNK_SIZE", 3)
+    path = tmp_path / "a.json"
+    path.write_text('{"vulnerabilities": [ ], "x": [1]}')
+    assert list(iter_json_array(path, "vulnerabilities")) == []
+    path.write_text('{"vulnerabilities": [12345, 678, "]", [9]]}')
+    assert list(iter_json_array(path, "vulnerabilities")) == [12345, 678, "]", [9]]
+    assert list(iter_json_array(path, "missing")) == []
+
+
+def test_index_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setattr(enrich, "CHUNK_SIZE", 64)
+    nvd = tmp_path / "nvdcve-2.0-2024.json"
+    nvd.write_text(json.dumps({"vulnerabilities": [
+        nvd_item("CVE-2024-1234", 9.8),
+        nvd_item("CVE-2024-0042", 5.3),
+        {"cve": {"id": "CVE-2024-5555", "metrics": {}}},
+    ]}))
+    legacy = tmp_path / "nvdcve-1.1-2017.json.gz"
+    with gzip.open(legacy, "wt", encoding="utf-8") as f:
+        json.dump({"CVE_Items": [{"cve": {"CVE_data_meta": {"ID": "CVE-2017-0144"}},
+                                  "impact": {"baseMetricV2": {"cvssV2": {"baseScore": 8.1}}}}]}, f)
+    kev = tmp_path / "kev.json"
+    kev.write_text(json.dumps({"vulnerabilities": [{"cveID": "CVE-2017-0144"}, {"cveID": "CVE-2023-9999"}]}))
+    epss = tmp_path / "epss.csv.gz"
+    with gzip.open(epss, "wt", encoding="utf-8") as f:
+        f.write("#model_version:v2025.03.14,score_date:2026-02-22\ncve,epss,percentile\n"
+                "CVE-2024-1234,0.97512,0.999\nCVE-2017-0144,0.5,0.9\nbogus,1,1\n")
+
+    builder = IndexBuilder()
+    assert builder.add_nvd(nvd) == 3
+    assert builder.add_nvd(legacy) == 1
+    assert builder.add_kev(kev) == 2
+    assert builder.add_epss(epss) == 2
+    assert builder.write(tmp_path / "cve_index.bin") == 5
+
+    index = CveIndex(tmp_path / "cve_index.bin")
+    assert index.lookup("cve-2024-1234") == {"id": "CVE-2024-1234", "cvss": 9.8, "epss": 0.9751, "kev": False}
+    assert index.lookup("CVE-2017-0144") == {"id": "CVE-2017-0144", "cvss": 8.1, "epss": 0.5, "kev": True}
+    # KEV-only and score-less records are kept with unknown fields
+    assert index.lookup("CVE-2023-9999") == {"id": "CVE-2023-9999", "cvss": None, "epss": None, "kev": True}
+    assert index.lookup("CVE-2024-5555")["cvss"] is None
+    assert index.lookup("CVE-2024-7777") is None
+    found = index.enrich("CVE-2024-0042 and CVE-2017-0144, again CVE-2024-0042, unknown CVE-2020-0001")
+    assert [c["id"] for c in found] == ["CVE-2024-0042", "CVE-2017-0144"]
+
+
+def test_cve_scores_raise_severity():
+    cve = {"id": "CVE-2024-1234", "cvss": None, "epss": None, "kev": False}
+    assert cve_severity(dict(cve, kev=True)) == "Critical"
+    assert cve_severity(dict(cve, cvss=9.0)) == "Critical"
+    assert cve_severity(dict(cve, cvss=7.0)) == "High"
+    assert cve_severity(dict(cve, epss=0.1)) == "High"
+    assert cve_severity(dict(cve, cvss=4.0)) == "Medium"
+    assert cve_severity(cve) == "Low"
+
+    assert compute_severity(("Malware",)) == "Low"
+    assert compute_severity(("Malware",), [dict(cve, cvss=7.5)]) == "High"
+    # Scores only ever raise the tag-based estimate
+    assert compute_severity(("Ransomware",), [dict(cve, cvss=4.0)]) == "High"
+    assert compute_severity(("Vulnerability",), [dict(cve, cvss=5.0), dict(cve, kev=True)]) == "Critical"
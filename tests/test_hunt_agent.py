@@ -0,0 +1,70 @@
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "docs" / "scripts"))
+
+import hunt_agent
+
+
+def make_tree(root):
+    (root / "bin" / "deep").mkdir(parents=True)
+    (root / "tmp").mkdir()
+    (root / "locked").mkdir()
+    for name, mode in (("su", 0o4755), ("sg", 0o2755), ("deep/su2", 0o4700), ("plain", 0o755)):
+        path = root / "bin" / name
+        path.write_bytes(b"#!/bin/sh\n")
+        path.chmod(mode)
+    dropped = root / "tmp" / "dropper"
+    dropped.write_bytes(b"\x7fELF" + b"\0" * 12)  # ELF without the x bit
+    (root / "tmp" / "notes.txt").write_text("hello")
+
+
+def run(root, **kwargs):
+    return hunt_agent.hunt([str(root)], temp_dirs=[str(root / "tmp")], workers=2, procs=False, **kwargs)
+
+
+def paths(report, kind, root):
+    return sorted(os.path.relpath(r["path"], root) for r in report["findings"][kind])
+
+
+def test_finds_suid_sgid_and_temp_executables(tmp_path, monkeypatch):
+    make_tree(tmp_path)
+    real_scandir = os.scandir
+
+    # chmod 000 does not stop root, so refuse the directory explicitly
+    def scandir(path):
+        if str(path).endswith("locked"):
+            raise PermissionError(13, "Permission denied", path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", scandir)
+    report = run(tmp_path)
+    assert paths(report, "suid", tmp_path) == ["bin/deep/su2", "bin/su"]
+    assert paths(report, "sgid", tmp_path) == ["bin/sg"]
+    assert paths(report, "recentTempExecutables", tmp_path) == ["tmp/dropper"]
+    assert report["scanned"]["errors"] == 1
+    assert report["scanned"]["files"] == 6
+    assert report["truncated"] is False
+
+
+def test_truncated_report_keeps_real_totals(tmp_path, monkeypatch):
+    make_tree(tmp_path)
+    monkeypatch.setattr(hunt_agent, "MAX_FINDINGS", 1)
+    report = run(tmp_path)
+    assert report["truncated"] is True
+    assert report["totals"]["suid"] == 2
+    assert len(report["findings"]["suid"]) == 1
+
+
+def test_bad_entry_is_counted_not_fatal(tmp_path, monkeypatch):
+    make_tree(tmp_path)
+
+    def broken(path, st):
+        raise ValueError("year is out of range")
+
+    monkeypatch.setattr(hunt_agent, "file_record", broken)
+    report = run(tmp_path)
+    assert report["scanned"]["errors"] == 4  # three SUID/SGID hits and the dropper
+    assert report["scanned"]["dirs"] == 5
+    assert hunt_agent.iso(1e20) == "1e+20"
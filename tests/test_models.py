@@ -0,0 +1,29 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "bot"))
+
+from models import Article, Recommendation, load_items
+
+
+def test_legacy_field_names():
+    article = Article.from_dict({"id": "a1", "description": "text", "tag": "Malware, Phishing"})
+    assert article.summary == "text"
+    assert article.tags == ("Malware", "Phishing")
+
+
+def test_missing_id_and_null_fields(tmp_path):
+    path = tmp_path / "news.json"
+    path.write_text('{"items": [{"title": "no id", "source": null}, {"id": "b", "source": null, "tags": null}]}')
+    _, items = load_items(path, Article)
+    assert [a.id for a in items] == ["", "b"]
+    assert items[1].source == ""
+    assert items[1].tags == ()
+
+    rec = Recommendation.from_dict({"source": None, "severity": None, "cves": None})
+    assert (rec.id, rec.source, rec.severity, rec.cves) == ("", "", "Low", [])
+
+
+def test_round_trip():
+    d = {"id": "a1", "date": "2026-02-22", "title": "t", "summary": "s", "url": "u", "source": "x", "tags": ["Malware"]}
+    assert Article.from_dict(d).to_dict() == d
@@ -0,0 +1,61 @@
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "bot"))
+
+import render_pages
+
+TEMPLATE = "<main><!-- prerender:start --><!-- prerender:end --></main>"
+
+
+def item(item_id, title):
+    return {"id": item_id, "date": "2026-02-22", "title": title, "source": "X", "severity": "High"}
+
+
+def setup(tmp_path, monkeypatch):
+    for name, rel in (("FEED_FILE", "docs/data/feed.json"), ("NEWS_PAGE", "docs/news.html"),
+                      ("RECO_PAGE", "docs/recommendations.html"), ("ITEMS_DIR", "docs/items"),
+                      ("MANIFEST_FILE", "data/render_manifest.json")):
+        monkeypatch.setattr(render_pages, name, tmp_path / rel)
+    (tmp_path / "docs" / "data").mkdir(parents=True)
+    render_pages.NEWS_PAGE.write_text(TEMPLATE)
+    render_pages.RECO_PAGE.write_text(TEMPLATE)
+
+
+def render(items, capsys):
+    render_pages.FEED_FILE.write_text(json.dumps({"items": items}))
+    render_pages.main()
+    return capsys.readouterr().out
+
+
+def test_unchanged_feed_is_not_rerendered(tmp_path, monkeypatch, capsys):
+    setup(tmp_path, monkeypatch)
+    feed = [item("a1", "First"), item("b2", "Second")]
+    assert "Rendered 4 changed page(s)" in render(feed, capsys)
+    assert "Second" in render_pages.NEWS_PAGE.read_text()
+    assert "Rendered 0 changed page(s)" in render(feed, capsys)
+
+
+def test_changed_item_is_rerendered(tmp_path, monkeypatch, capsys):
+    setup(tmp_path, monkeypatch)
+    render([item("a1", "First"), item("b2", "Second")], capsys)
+    # The detail page of b2 and both list pages change, a1 is kept
+    assert "Rendered 3 changed page(s)" in render([item("a1", "First"), item("b2", "Second, updated")], capsys)
+    assert "Second, updated" in (render_pages.ITEMS_DIR / "b2.html").read_text()
+    assert "Second, updated" in render_pages.RECO_PAGE.read_text()
+
+
+def test_item_leaving_feed_deletes_its_page(tmp_path, monkeypatch, capsys):
+    setup(tmp_path, monkeypatch)
+    render([item("a1", "First"), item("b2", "Second")], capsys)
+    assert "removed 1 stale" in render([item("b2", "Second")], capsys)
+    assert [p.name for p in render_pages.ITEMS_DIR.iterdir()] == ["b2.html"]
+    manifest = json.loads(render_pages.MANIFEST_FILE.read_text())
+    assert not any(key.endswith("a1.html") for key in manifest)
+
+    # An empty feed still prunes what is left
+    assert "removed 1 stale" in render([], capsys)
+    assert list(render_pages.ITEMS_DIR.iterdir()) == []
+    manifest = json.loads(render_pages.MANIFEST_FILE.read_text())
+    assert not any(key.startswith(str(render_pages.ITEMS_DIR)) for key in manifest)
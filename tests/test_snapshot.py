@@ -0,0 +1,25 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "bot"))
+
+from models import Recommendation
+from snapshot import Snapshot, write_snapshot
+
+
+def test_round_trip_with_non_ascii_id(tmp_path):
+    items = [
+        Recommendation(id="ид", date="2026-02-22", title="Заголовок", source="A", tags=("Malware",), severity="High"),
+        Recommendation(id="eb2e02c65a66", date="bad", title="t", source="B", tech=("Linux", "Cloud")),
+    ]
+    path = tmp_path / "archive.snap"
+    write_snapshot(items, path)
+    with Snapshot(path) as snap:
+        assert snap.ids() == ["ид", "eb2e02c65a66"]
+        assert snap.dates() == ["2026-02-22", ""]
+        assert snap.column("severity") == ["High", "Low"]
+        assert snap.column("tags") == [("Malware",), ()]
+        assert snap.column("tech") == [(), ("Linux", "Cloud")]
+        assert snap.text("title", 0) == "Заголовок"
+    assert snap._mm.closed
+    snap.close()